@@ -24,13 +24,18 @@ Example usage:
     display.draw_circle(160, 120, 50, color="red")
 """
 
+from array import array
+import gc
+from struct import pack_into
 from machine import Pin, SPI
 from time import sleep as time_sleep
 from framebuf import FrameBuffer, RGB565
+import micropython
 from micropython import const
 
 
-def color565(r, g, b):
+@micropython.viper
+def color565(r: int, g: int, b: int) -> int:
     """Convert RGB values to 16-bit color format.
 
     Args:
@@ -44,6 +49,151 @@ def color565(r, g, b):
     return (b & 0xF8) << 8 | (g & 0xFC) << 3 | r >> 3
 
 
+@micropython.viper
+def _bswap16(color: int) -> int:
+    """Swap the bytes of a 16-bit color for framebuf (little-endian) writes."""
+    return ((color & 0xFF) << 8) | ((color >> 8) & 0xFF)
+
+
+# Edge tables for recently filled polygons, keyed by tuple(points)
+_POLY_CACHE_SIZE = const(8)
+_poly_cache = {}
+
+
+def _build_edge_table(points):
+    """Build the scanline edge table for a polygon.
+
+    Args:
+        points (list): List of (x, y) coordinate tuples
+
+    Returns:
+        tuple: (min_y, max_y, edges) where edges is a list of
+            (edge_min_y, edge_max_y, x1, y1, dx, dy, x_step, remainder_step)
+            sorted by edge_min_y. dy is made positive, and x_step and
+            remainder_step are dx divided by dy (the per-scanline slope).
+    """
+    edges = []
+    x1, y1 = points[-1]  # The closing edge runs from the last point
+    min_y = max_y = y1
+    for x2, y2 in points:
+        # Track the bounding rows in the same pass
+        if y2 < min_y:
+            min_y = y2
+        elif y2 > max_y:
+            max_y = y2
+
+        # Skip horizontal edges
+        if y1 != y2:
+            # Keep the original start point so crossings round the same way,
+            # with the slope's sign moved into dx
+            dx = x2 - x1
+            dy = y2 - y1
+            if dy < 0:
+                dx = -dx
+                dy = -dy
+            x_step, remainder_step = divmod(dx, dy)
+
+            edges.append((min(y1, y2), max(y1, y2), x1, y1, dx, dy, x_step, remainder_step))
+
+        x1, y1 = x2, y2
+
+    edges.sort()
+    return min_y, max_y, edges
+
+
+def _get_edge_table(points):
+    """Return the (cached) edge table for a polygon."""
+    try:
+        key = tuple(points)
+        table = _poly_cache.get(key)
+    except TypeError:
+        # Points given as lists aren't hashable - just don't cache them
+        return _build_edge_table(points)
+
+    if table is None:
+        table = _build_edge_table(points)
+        if len(_poly_cache) >= _POLY_CACHE_SIZE:
+            _poly_cache.clear()
+        _poly_cache[key] = table
+    return table
+
+
+def _ellipse_steps(a, b):
+    """Step around one quarter of an ellipse with the Bresenham algorithm.
+
+    Args:
+        a, b (int): Horizontal and vertical semi-axes
+
+    Yields:
+        tuple: (dx, dy) offsets from the center, from (0, b) down to dy == 0
+    """
+    a2 = a * a
+    b2 = b * b
+    twoa2 = 2 * a2
+    twob2 = 2 * b2
+
+    # Region 1
+    px = 0
+    py = twoa2 * b
+
+    # Initial point
+    yield 0, b
+
+    # Region 1 - horizontal direction. The decision values only need
+    # rounding, and a square is 0 or 1 mod 4, so the quarter terms round
+    # down exactly with integer division - no floats needed
+    p = b2 - (a2 * b) + (a2 // 4)
+    dx = 0
+    dy = b
+
+    while px < py:
+        dx += 1
+        px += twob2
+        if p < 0:
+            p += b2 + px
+        else:
+            dy -= 1
+            py -= twoa2
+            p += b2 + px - py
+        yield dx, dy
+
+    # Region 2 - vertical direction
+    p = b2 * (dx * dx + dx) + (b2 // 4) + a2 * (dy - 1) * (dy - 1) - a2 * b2
+
+    while dy > 0:
+        dy -= 1
+        py -= twoa2
+        if p > 0:
+            p += a2 - py
+        else:
+            dx += 1
+            px += twob2
+            p += a2 - py + px
+        yield dx, dy
+
+
+def _ellipse_rows(a, b):
+    """Get the half-width of each row of an ellipse.
+
+    Uses the same integer steps as the outline; the last step on each row
+    is the widest, so it gives that row's half-width.
+
+    Args:
+        a, b (int): Horizontal and vertical semi-axes
+
+    Yields:
+        tuple: (half_width, dy) for each dy from b down to 0
+    """
+    half_width = 0
+    row_dy = b
+    for dx, dy in _ellipse_steps(a, b):
+        if dy != row_dy:
+            yield half_width, row_dy
+            row_dy = dy
+        half_width = dx
+    yield half_width, row_dy
+
+
 class Display:
     """Simple display interface for students."""
 
@@ -86,6 +236,36 @@ class Display:
     ENABLE3G = const(0xF2)
     PUMPRC = const(0xF7)
 
+    # Initialization sequence: command, argument count, arguments...
+    # (0x80 in the count means wait 100ms after the command)
+    _INIT_SEQUENCE = bytes((
+        SWRESET, 0x80,
+        PWCTRB, 3, 0x00, 0xC1, 0x30,
+        POSC, 4, 0x64, 0x03, 0x12, 0x81,
+        DTCA, 3, 0x85, 0x00, 0x78,
+        PWCTRA, 5, 0x39, 0x2C, 0x00, 0x34, 0x02,
+        PUMPRC, 1, 0x20,
+        DTCB, 2, 0x00, 0x00,
+        PWCTR1, 1, 0x23,
+        PWCTR2, 1, 0x10,
+        VMCTR1, 2, 0x3E, 0x28,
+        VMCTR2, 1, 0x86,
+        MADCTL, 1, 0xE0,  # Landscape rotation
+        VSCRSADD, 1, 0x00,
+        PIXFMT, 1, 0x55,
+        FRMCTR1, 2, 0x00, 0x18,
+        DFUNCTR, 3, 0x08, 0x82, 0x27,
+        ENABLE3G, 1, 0x00,
+        GAMMASET, 1, 0x01,
+        # Gamma correction (simplified)
+        GMCTRP1, 15, 0x0F, 0x31, 0x2B, 0x0C, 0x0E, 0x08, 0x4E, 0xF1,
+        0x37, 0x07, 0x10, 0x03, 0x0E, 0x09, 0x00,
+        GMCTRN1, 15, 0x00, 0x0E, 0x14, 0x03, 0x11, 0x07, 0x31, 0xC1,
+        0x48, 0x08, 0x0F, 0x0C, 0x31, 0x36, 0x0F,
+        SLPOUT, 0x80,
+        DISPLAY_ON, 0x80,
+    ))
+
     # Color constants
     COLORS = {
         "black": color565(0, 0, 0),
@@ -104,25 +284,56 @@ class Display:
         "grey": color565(128, 128, 128),
     }
 
-    def __init__(self, width=320, height=240):
+    def __init__(self, width=320, height=240, framebuffer=None):
         """Initialize the display with default ESP32-2432S028R pinout.
 
         Args:
             width (int): Display width in pixels (default: 320)
             height (int): Display height in pixels (default: 240)
+            framebuffer (bool): Keep a full-screen copy of the display in RAM
+                (width * height * 2 bytes). None (default) uses one only if
+                there's plenty of free memory, True always tries, False never.
         """
         self.width = width
         self.height = height
 
+        # Full-screen framebuffer (set up after the display if requested)
+        self._fb = None
+        self._fbuf = None
+        self._dirty = None
+
+        # Set while the display is held selected by begin_frame()
+        self._in_frame = False
+
         # Pixel buffer for performance optimization
-        self._pixel_buffer = {}
+        # (y << 16 | x positions and colors kept in parallel arrays)
+        self._buffer_pos = array("I")
+        self._buffer_colors = array("H")
         self._buffering_enabled = False
         
-        # Color parsing cache for performance
+        # Color parsing cache and per-type parsers for performance
         self._color_cache = {}
+        self._color_get = self.COLORS.get
+        self._color_parsers = {
+            str: self._color_from_name,
+            tuple: self._color_from_rgb,
+            list: self._color_from_rgb,
+        }
+
+        # Pre-filled rows of pixel data per color, sliced for solid spans
+        self._color_rows = {}
+
+        # Reusable pixel buffer for rendering text
+        self._text_buf = bytearray(0)
+
+        # Reusable SPI buffers for setting the address window
+        self._cmd_col = bytearray((self.SET_COLUMN,))
+        self._cmd_page = bytearray((self.SET_PAGE,))
+        self._cmd_ram = bytearray((self.WRITE_RAM,))
+        self._addr_buf = bytearray(4)
 
         # Default pin configuration for ESP32-2432S028R (CYD)
-        self._setup_display()
+        self._setup_display(framebuffer)
 
         # Turn on backlight
         self._setup_backlight()
@@ -130,7 +341,7 @@ class Display:
         # Clear screen to black
         self.clear()
 
-    def _setup_display(self):
+    def _setup_display(self, framebuffer=None):
         """Set up the display hardware (internal use only)."""
         try:
             # Set up SPI for display (standard CYD pinout)
@@ -144,6 +355,9 @@ class Display:
             # Initialize display
             self._init_display()
 
+            if framebuffer is not False:
+                self._setup_framebuffer(framebuffer)
+
         except ImportError as e:
             print(f"Display setup failed - missing module: {e}")
             print("This module requires MicroPython with machine module support")
@@ -157,6 +371,40 @@ class Display:
             print(f"Error type: {type(e).__name__}")
             self._create_dummy_methods()
 
+    FRAMEBUFFER_HEADROOM = 32768  # Free RAM to leave when auto-allocating
+    SPI_CHUNK = 4096  # Bytes gathered per SPI write when sending partial rows
+
+    def _setup_framebuffer(self, framebuffer):
+        """Allocate a full-screen framebuffer if requested and RAM allows.
+
+        With a framebuffer, drawing goes into RAM first and only the changed
+        region is sent to the display, so buffered drawing is flushed as a
+        single block instead of pixel by pixel.
+
+        Args:
+            framebuffer (bool): True to always try, None to only allocate
+                when there is memory to spare
+        """
+        size = self.width * self.height * 2
+        if framebuffer is None:
+            gc.collect()
+            if gc.mem_free() < size + self.FRAMEBUFFER_HEADROOM:
+                return  # Not enough RAM to spare - draw directly instead
+
+        try:
+            self._fb = bytearray(size)
+        except MemoryError:
+            print("Not enough memory for a framebuffer - drawing directly")
+            return
+
+        self._fbuf = FrameBuffer(self._fb, self.width, self.height, RGB565)
+        self._spi_buf = bytearray(self.SPI_CHUNK)
+
+        # Route all block writes through the framebuffer
+        self._lcd_block = self._block
+        self._block = self._fb_block
+        self._fill_block = self._fb_fill_block
+
     def _setup_backlight(self):
         """Turn on the display backlight."""
         try:
@@ -173,93 +421,238 @@ class Display:
         self.rst.on()
         time_sleep(0.1)
 
-        # Send initialization commands
-        self._write_cmd(self.SWRESET)
-        time_sleep(0.1)
-        self._write_cmd(self.PWCTRB, 0x00, 0xC1, 0x30)
-        self._write_cmd(self.POSC, 0x64, 0x03, 0x12, 0x81)
-        self._write_cmd(self.DTCA, 0x85, 0x00, 0x78)
-        self._write_cmd(self.PWCTRA, 0x39, 0x2C, 0x00, 0x34, 0x02)
-        self._write_cmd(self.PUMPRC, 0x20)
-        self._write_cmd(self.DTCB, 0x00, 0x00)
-        self._write_cmd(self.PWCTR1, 0x23)
-        self._write_cmd(self.PWCTR2, 0x10)
-        self._write_cmd(self.VMCTR1, 0x3E, 0x28)
-        self._write_cmd(self.VMCTR2, 0x86)
-        self._write_cmd(self.MADCTL, 0xE0)  # Landscape rotation
-        self._write_cmd(self.VSCRSADD, 0x00)
-        self._write_cmd(self.PIXFMT, 0x55)
-        self._write_cmd(self.FRMCTR1, 0x00, 0x18)
-        self._write_cmd(self.DFUNCTR, 0x08, 0x82, 0x27)
-        self._write_cmd(self.ENABLE3G, 0x00)
-        self._write_cmd(self.GAMMASET, 0x01)
+        # Send the initialization table with CS held for the whole sequence
+        seq = memoryview(self._INIT_SEQUENCE)
+        dc = self.dc
+        write = self.spi.write
+        i = 0
+        self.cs.off()
 
-        # Gamma correction (simplified)
-        self._write_cmd(
-            self.GMCTRP1,
-            0x0F,
-            0x31,
-            0x2B,
-            0x0C,
-            0x0E,
-            0x08,
-            0x4E,
-            0xF1,
-            0x37,
-            0x07,
-            0x10,
-            0x03,
-            0x0E,
-            0x09,
-            0x00,
-        )
-        self._write_cmd(
-            self.GMCTRN1,
-            0x00,
-            0x0E,
-            0x14,
-            0x03,
-            0x11,
-            0x07,
-            0x31,
-            0xC1,
-            0x48,
-            0x08,
-            0x0F,
-            0x0C,
-            0x31,
-            0x36,
-            0x0F,
-        )
-
-        self._write_cmd(self.SLPOUT)
-        time_sleep(0.1)
-        self._write_cmd(self.DISPLAY_ON)
-        time_sleep(0.1)
+        try:
+            while i < len(seq):
+                count = seq[i + 1]
+                dc.off()  # Command mode
+                write(seq[i:i + 1])
+                i += 2
+
+                args = count & 0x7F
+                if args:
+                    dc.on()  # Data mode
+                    write(seq[i:i + args])
+                    i += args
+
+                if count & 0x80:
+                    time_sleep(0.1)
+
+        finally:
+            self.cs.on()
 
     def _write_cmd(self, command, *args):
         """Write command to display."""
-        self.cs.off()
+        if not self._in_frame:
+            self.cs.off()
         self.dc.off()  # Command mode
         self.spi.write(bytearray([command]))
         if args:
             self.dc.on()  # Data mode
             self.spi.write(bytearray(args))
-        self.cs.on()
+        if not self._in_frame:
+            self.cs.on()
 
     def _write_data(self, data):
         """Write data to display."""
-        self.cs.off()
+        if not self._in_frame:
+            self.cs.off()
         self.dc.on()  # Data mode
         self.spi.write(data)
-        self.cs.on()
+        if not self._in_frame:
+            self.cs.on()
+
+    @micropython.native
+    def _set_window(self, x0, y0, x1, y1):
+        """Set the address window and start a RAM write.
 
+        CS must already be low; DC is left in data mode, ready for pixels.
+        """
+        dc = self.dc
+        write = self.spi.write
+        addr = self._addr_buf
+
+        # Send SET_COLUMN command
+        dc.off()  # Command mode
+        write(self._cmd_col)
+        dc.on()  # Data mode
+        pack_into(">HH", addr, 0, x0, x1)
+        write(addr)
+
+        # Send SET_PAGE command
+        dc.off()  # Command mode
+        write(self._cmd_page)
+        dc.on()  # Data mode
+        pack_into(">HH", addr, 0, y0, y1)
+        write(addr)
+
+        # Send WRITE_RAM command
+        dc.off()  # Command mode
+        write(self._cmd_ram)
+        dc.on()  # Data mode
+
+    @micropython.native
     def _block(self, x0, y0, x1, y1, data):
-        """Write a block of data to display."""
-        self._write_cmd(self.SET_COLUMN, x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF)
-        self._write_cmd(self.SET_PAGE, y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF)
-        self._write_cmd(self.WRITE_RAM)
-        self._write_data(data)
+        """Write a block of data to display in a single SPI transaction."""
+        if not self._in_frame:
+            self.cs.off()
+        try:
+            self._set_window(x0, y0, x1, y1)
+            self.spi.write(data)
+        finally:
+            if not self._in_frame:
+                self.cs.on()
+
+    @micropython.native
+    def _fill_block(self, x0, y0, x1, y1, row_data):
+        """Fill a block by sending the same row of data for every line.
+
+        The display wraps to the next line of the address window by itself,
+        so one window and repeated writes of a single row fill the block.
+        """
+        write = self.spi.write
+        if not self._in_frame:
+            self.cs.off()
+        try:
+            self._set_window(x0, y0, x1, y1)
+            for _ in range(y1 - y0 + 1):
+                write(row_data)
+        finally:
+            if not self._in_frame:
+                self.cs.on()
+
+    def _fb_block(self, x0, y0, x1, y1, data):
+        """Write a block of data into the framebuffer, then show it.
+
+        Replaces _block when a framebuffer is in use. The block may run off
+        the right or bottom edge of the screen (e.g. long text).
+        """
+        data = memoryview(data)
+        fb = self._fb
+        row_bytes = (x1 - x0 + 1) * 2
+        x1 = min(x1, self.width - 1)
+        y1 = min(y1, self.height - 1)
+        copy_bytes = (x1 - x0 + 1) * 2
+        stride = self.width * 2
+        offset = y0 * stride + x0 * 2
+        src = 0
+
+        for _ in range(y1 - y0 + 1):
+            fb[offset:offset + copy_bytes] = data[src:src + copy_bytes]
+            offset += stride
+            src += row_bytes
+
+        self._fb_show(x0, y0, x1, y1)
+
+    def _fb_fill_block(self, x0, y0, x1, y1, row_data):
+        """Fill a framebuffer block with the same row on every line, then show it.
+
+        Replaces _fill_block when a framebuffer is in use.
+        """
+        fb = self._fb
+        row_bytes = (x1 - x0 + 1) * 2
+        stride = self.width * 2
+        offset = y0 * stride + x0 * 2
+
+        for _ in range(y1 - y0 + 1):
+            fb[offset:offset + row_bytes] = row_data
+            offset += stride
+
+        self._fb_show(x0, y0, x1, y1)
+
+    def _fb_show(self, x0, y0, x1, y1):
+        """Send a changed framebuffer region to the display.
+
+        While buffering, the region is just added to the area that
+        _flush_buffer() will send.
+
+        Args:
+            x0, y0, x1, y1 (int): Region corners, already clipped to the screen
+        """
+        if self._buffering_enabled:
+            dirty = self._dirty
+            if dirty is None:
+                self._dirty = [x0, y0, x1, y1]
+            else:
+                if x0 < dirty[0]:
+                    dirty[0] = x0
+                if y0 < dirty[1]:
+                    dirty[1] = y0
+                if x1 > dirty[2]:
+                    dirty[2] = x1
+                if y1 > dirty[3]:
+                    dirty[3] = y1
+            return
+
+        self._send_region(x0, y0, x1, y1)
+
+    def _fb_show_clipped(self, x0, y0, x1, y1):
+        """Show a framebuffer region that may extend past the screen edges."""
+        if x0 < 0:
+            x0 = 0
+        if y0 < 0:
+            y0 = 0
+        if x1 >= self.width:
+            x1 = self.width - 1
+        if y1 >= self.height:
+            y1 = self.height - 1
+        if x0 <= x1 and y0 <= y1:
+            self._fb_show(x0, y0, x1, y1)
+
+    def _send_region(self, x0, y0, x1, y1):
+        """Write a framebuffer region to the display in one address window."""
+        if (x1 - x0 + 1) * 10 >= self.width * 7:
+            # Mostly full width anyway - full rows go out in a single write
+            x0 = 0
+            x1 = self.width - 1
+
+        fb = memoryview(self._fb)
+        stride = self.width * 2
+        start = y0 * stride + x0 * 2
+
+        if x0 == 0 and x1 == self.width - 1:
+            # Full-width rows are contiguous in the framebuffer
+            self._lcd_block(x0, y0, x1, y1, fb[start:(y1 + 1) * stride])
+            return
+
+        # Otherwise stream the rows into the same window, gathering narrow
+        # rows into chunks so each SPI write carries a worthwhile payload
+        row_bytes = (x1 - x0 + 1) * 2
+        rows_per_write = self.SPI_CHUNK // row_bytes
+        rows = y1 - y0 + 1
+        write = self.spi.write
+        if not self._in_frame:
+            self.cs.off()
+
+        try:
+            self._set_window(x0, y0, x1, y1)
+            if rows_per_write < 2:
+                for _ in range(rows):
+                    write(fb[start:start + row_bytes])
+                    start += stride
+                return
+
+            buf = self._spi_buf
+            chunk = memoryview(buf)
+            while rows:
+                count = min(rows, rows_per_write)
+                pos = 0
+                for _ in range(count):
+                    buf[pos:pos + row_bytes] = fb[start:start + row_bytes]
+                    pos += row_bytes
+                    start += stride
+                write(chunk[:pos])
+                rows -= count
+
+        finally:
+            if not self._in_frame:
+                self.cs.on()
 
     def _create_dummy_methods(self):
         """Create dummy methods if display init fails."""
@@ -270,6 +663,11 @@ class Display:
         self._write_cmd = dummy
         self._write_data = dummy
         self._block = dummy
+        self._fill_block = dummy
+        self.begin_frame = dummy
+        self.end_frame = dummy
+
+    COLOR_CACHE_SIZE = 64  # RGB tuples remembered by _parse_color
 
     def _parse_color(self, color):
         """Convert color string or RGB values to 16-bit color.
@@ -283,23 +681,46 @@ class Display:
         Returns:
             int: 16-bit color value
         """
-        if isinstance(color, str):
-            color = color.lower()
-            if color in self.COLORS:
-                return self.COLORS[color]
-            else:
-                return self.COLORS["white"]  # Default to white for unknown colors
-        elif isinstance(color, (list, tuple)) and len(color) >= 3:
-            # Use cache for RGB conversions
-            rgb_key = (color[0], color[1], color[2])
-            if rgb_key not in self._color_cache:
-                self._color_cache[rgb_key] = color565(color[0], color[1], color[2])
-            return self._color_cache[rgb_key]
-        elif isinstance(color, int):
+        # Already-parsed values are passed back in by the drawing helpers
+        if type(color) is int:
+            return color
+
+        parser = self._color_parsers.get(type(color))
+        if parser is not None:
+            return parser(color)
+
+        # Subclasses of the supported types (e.g. bool, namedtuples)
+        if isinstance(color, int):
             return color
+        elif isinstance(color, str):
+            return self._color_from_name(color)
+        elif isinstance(color, (list, tuple)):
+            return self._color_from_rgb(color)
         else:
             return self.COLORS["white"]  # Default to white
 
+    def _color_from_name(self, color):
+        """Look up a color name, defaulting to white for unknown names."""
+        value = self._color_get(color)
+        if value is None:
+            value = self._color_get(color.lower(), self.COLORS["white"])
+        return value
+
+    def _color_from_rgb(self, color):
+        """Convert an (r, g, b) tuple or list to a 16-bit color."""
+        if len(color) < 3:
+            return self.COLORS["white"]  # Default to white
+
+        # Use cache for RGB conversions
+        rgb_key = (color[0], color[1], color[2])
+        value = self._color_cache.get(rgb_key)
+        if value is None:
+            if len(self._color_cache) >= self.COLOR_CACHE_SIZE:
+                self._color_cache.clear()
+            value = color565(color[0], color[1], color[2])
+            self._color_cache[rgb_key] = value
+        return value
+
     def _validate_bounds(self, x, y):
         """Validate coordinates are within screen bounds.
         
@@ -338,16 +759,47 @@ class Display:
             count (int): Number of pixels worth of data to prepare
             
         Returns:
-            bytes: Color data ready for SPI transmission
+            bytes: Color data ready for SPI transmission (a view of a cached
+                row when it's long enough, so don't modify it)
         """
         color_val = self._parse_color(color)
+        row = self._color_row(color_val)
+        if count * 2 <= len(row):
+            return row[:count * 2]
         return color_val.to_bytes(2, "big") * count
 
-    MAX_BUFFERED_PIXELS = 500  # Safety limit
+    COLOR_ROW_CACHE_SIZE = 4  # Distinct colors kept as pre-filled rows
+
+    def _color_row(self, color_val):
+        """Get a reusable row of pixel data filled with a single color.
+
+        Args:
+            color_val (int): 16-bit color value
+
+        Returns:
+            memoryview: Row data for the longest possible line; slice it to
+                the span length (2 bytes per pixel) instead of allocating
+        """
+        row = self._color_rows.get(color_val)
+        if row is None:
+            if len(self._color_rows) >= self.COLOR_ROW_CACHE_SIZE:
+                self._color_rows.clear()
+            # Fill the row in C through a one-line framebuffer rather than
+            # multiplying out a temporary bytes object
+            row_length = max(self.width, self.height)
+            buf = bytearray(row_length * 2)
+            FrameBuffer(buf, row_length, 1, RGB565).fill(_bswap16(color_val))
+            row = memoryview(buf)
+            self._color_rows[color_val] = row
+        return row
+
+    MAX_BUFFERED_PIXELS = 2000  # Safety limit (6 bytes per buffered pixel)
 
     def _start_buffering(self):
         """Start buffering pixel operations for performance."""
-        self._pixel_buffer.clear()
+        self._buffer_pos = array("I")
+        self._buffer_colors = array("H")
+        self._dirty = None
         self._buffering_enabled = True
 
     def _smart_buffering(self, operation_count_estimate):
@@ -372,73 +824,91 @@ class Display:
 
         color_val = self._parse_color(color)
 
+        if self._fbuf is not None:
+            self._fbuf.pixel(x, y, _bswap16(color_val))
+            self._fb_show(x, y, x, y)
+            return
+
         if self._buffering_enabled:
             # Safety check: prevent memory exhaustion, but don't flush mid-operation
-            if len(self._pixel_buffer) >= self.MAX_BUFFERED_PIXELS:
+            if len(self._buffer_pos) >= self.MAX_BUFFERED_PIXELS:
                 # Just draw this pixel directly instead of breaking the batch
                 pixel_data = color_val.to_bytes(2, "big")
                 self._block(x, y, x, y, pixel_data)
                 return
 
-            self._pixel_buffer[(x, y)] = color_val
+            self._buffer_pos.append(y << 16 | x)
+            self._buffer_colors.append(color_val)
         else:
             pixel_data = color_val.to_bytes(2, "big")
             self._block(x, y, x, y, pixel_data)
 
     def _flush_buffer(self):
         """Flush all buffered pixels to the display with optimized SPI batching."""
-        if not self._pixel_buffer:
+        if self._fb is not None:
+            # Everything is already in the framebuffer - send the changed area
+            self._buffering_enabled = False
+            if self._dirty is not None:
+                self._send_region(*self._dirty)
+                self._dirty = None
+            return
+
+        positions = self._buffer_pos
+        colors = self._buffer_colors
+        count = len(positions)
+        if not count:
+            self._buffering_enabled = False
             return
 
-        # Group consecutive pixels by row for efficient SPI transfers
-        rows = {}
-        for (x, y), color in self._pixel_buffer.items():
-            if y not in rows:
-                rows[y] = []
-            rows[y].append((x, color))
+        # Sort by row then column; the sort is stable, so when a pixel was
+        # drawn more than once its last color comes last
+        order = sorted(range(count), key=lambda i: positions[i])
 
         # Prepare all block operations for batched execution
         block_operations = []
+        run_pos = -1
+        run_end = -2  # Nothing can extend the first run
+        run_color = 0
 
-        for y, pixels in rows.items():
-            pixels.sort()  # Sort by x coordinate
+        for n in range(count):
+            i = order[n]
+            pos = positions[i]
+            if n + 1 < count and positions[order[n + 1]] == pos:
+                continue  # Overdrawn later in the batch
 
-            # Group consecutive pixels into blocks
-            i = 0
-            while i < len(pixels):
-                start_x = pixels[i][0]
-                start_color = pixels[i][1]
-                end_x = start_x
-
-                # Find consecutive pixels with same color
-                j = i + 1
-                while (
-                    j < len(pixels)
-                    and pixels[j][0] == end_x + 1
-                    and pixels[j][1] == start_color
-                ):
-                    end_x = pixels[j][0]
-                    j += 1
-
-                # Prepare block operation
-                if start_x == end_x:
-                    # Single pixel
-                    pixel_data = start_color.to_bytes(2, "big")
-                    block_operations.append((start_x, y, start_x, y, pixel_data))
-                else:
-                    # Multiple consecutive pixels
-                    width = end_x - start_x + 1
-                    line_data = start_color.to_bytes(2, "big") * width
-                    block_operations.append((start_x, y, end_x, y, line_data))
+            color = colors[i]
+            if pos == run_end + 1 and color == run_color:
+                run_end = pos  # Extend the run along the row
+                continue
+
+            if run_pos >= 0:
+                self._add_run(block_operations, run_pos, run_end, run_color)
+            run_pos = run_end = pos
+            run_color = color
 
-                i = j
+        self._add_run(block_operations, run_pos, run_end, run_color)
 
         # Execute all block operations with minimal GPIO overhead
         self._execute_block_batch(block_operations)
 
-        self._pixel_buffer.clear()
+        self._buffer_pos = array("I")
+        self._buffer_colors = array("H")
         self._buffering_enabled = False
 
+    def _add_run(self, block_operations, start, end, color):
+        """Queue a block operation for a run of same-colored pixels in a row.
+
+        Args:
+            block_operations (list): Operations for _execute_block_batch
+            start, end (int): Packed y << 16 | x positions of the run's ends
+            color (int): 16-bit color value
+        """
+        y = start >> 16
+        start_x = start & 0xFFFF
+        end_x = end & 0xFFFF
+        line_data = self._color_row(color)[:(end_x - start_x + 1) * 2]
+        block_operations.append((start_x, y, end_x, y, line_data))
+
     def _execute_block_batch(self, block_operations):
         """Execute multiple block operations with optimized SPI batching.
 
@@ -448,34 +918,22 @@ class Display:
         if not block_operations:
             return
 
+        set_window = self._set_window
+        write = self.spi.write
+
         # Start SPI transaction - keep CS low for entire batch
-        self.cs.off()
+        if not self._in_frame:
+            self.cs.off()
 
         try:
             for x0, y0, x1, y1, data in block_operations:
-                # Send SET_COLUMN command
-                self.dc.off()  # Command mode
-                self.spi.write(bytearray([self.SET_COLUMN]))
-                self.dc.on()  # Data mode
-                self.spi.write(bytearray([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF]))
-
-                # Send SET_PAGE command
-                self.dc.off()  # Command mode
-                self.spi.write(bytearray([self.SET_PAGE]))
-                self.dc.on()  # Data mode
-                self.spi.write(bytearray([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF]))
-
-                # Send WRITE_RAM command
-                self.dc.off()  # Command mode
-                self.spi.write(bytearray([self.WRITE_RAM]))
-
-                # Send pixel data
-                self.dc.on()  # Data mode
-                self.spi.write(data)
+                set_window(x0, y0, x1, y1)
+                write(data)
 
         finally:
             # Always end SPI transaction
-            self.cs.on()
+            if not self._in_frame:
+                self.cs.on()
 
 
     def clear(self, color="black"):
@@ -486,12 +944,14 @@ class Display:
         """
         color_val = self._parse_color(color)
 
-        # Clear in chunks to avoid memory issues
-        chunk_height = 8
-        line_data = color_val.to_bytes(2, "big") * (self.width * chunk_height)
+        if self._fbuf is not None:
+            self._fbuf.fill(_bswap16(color_val))
+            self._fb_show(0, 0, self.width - 1, self.height - 1)
+            return
 
-        for y in range(0, self.height, chunk_height):
-            self._block(0, y, self.width - 1, y + chunk_height - 1, line_data)
+        # One address window for the whole screen, filled a row at a time
+        row = self._color_row(color_val)[:self.width * 2]
+        self._fill_block(0, 0, self.width - 1, self.height - 1, row)
 
     def show_text(self, text, color="white", background="black"):
         """Display text on screen with automatic wrapping.
@@ -557,32 +1017,37 @@ class Display:
         bg_color = self._parse_color(background)
         self._draw_text_8x8(x, y, str(text), text_color, bg_color)
 
+    @micropython.native
     def _wrap_text(self, text, chars_per_line=38):
         """Wrap text to fit on screen."""
         if len(text) <= chars_per_line:
             return [text]
 
+        # Scan word boundaries by index and slice each line out of the text
+        length = len(text)
         lines = []
-        words = text.split(" ")
-        current_words = []
-        current_length = 0
+        line_start = 0
+        line_end = text.find(" ")
+        if line_end < 0:
+            return [text]
 
-        for word in words:
-            word_length = len(word)
-            needed_length = current_length + word_length + (1 if current_words else 0)
-            
-            if needed_length <= chars_per_line:
-                current_words.append(word)
-                current_length = needed_length
+        while True:
+            pos = line_end + 1
+            word_end = text.find(" ", pos)
+            if word_end < 0:
+                word_end = length
+
+            if word_end - line_start <= chars_per_line:
+                line_end = word_end  # Word fits on the current line
             else:
-                if current_words:
-                    lines.append(" ".join(current_words))
-                current_words = [word]
-                current_length = word_length
+                lines.append(text[line_start:line_end])
+                line_start = pos
+                line_end = word_end
 
-        if current_words:
-            lines.append(" ".join(current_words))
+            if word_end == length:
+                break
 
+        lines.append(text[line_start:line_end])
         return lines
 
     def _draw_text_8x8(self, x, y, text, color, background=0):
@@ -597,22 +1062,24 @@ class Display:
         w = len(text) * 8
         h = 8
 
-        # Create framebuffer for text
-        buf = bytearray(w * 16)  # 16 bits per pixel
+        # Colors are byte-swapped for framebuffer endianness
+        if self._fbuf is not None:
+            # Render straight into the main framebuffer
+            self._fbuf.fill_rect(x, y, w, h, _bswap16(background))
+            self._fbuf.text(text, x, y, _bswap16(color))
+            self._fb_show_clipped(x, y, x + w - 1, y + h - 1)
+            return
+
+        # Render into a reusable buffer that grows to the longest text seen
+        size = w * h * 2  # 16 bits per pixel
+        if len(self._text_buf) < size:
+            self._text_buf = bytearray(size)
+        buf = memoryview(self._text_buf)[:size]
         fbuf = FrameBuffer(buf, w, h, RGB565)
 
         # Always fill background to avoid random memory data corruption
-        if background != 0:
-            # Swap bytes for framebuffer endianness
-            b_color = ((background & 0xFF) << 8) | ((background & 0xFF00) >> 8)
-        else:
-            # Use black (0) as background but still fill the buffer
-            b_color = 0
-        fbuf.fill(b_color)
-
-        # Swap bytes for framebuffer endianness
-        t_color = ((color & 0xFF) << 8) | ((color & 0xFF00) >> 8)
-        fbuf.text(text, 0, 0, t_color)
+        fbuf.fill(_bswap16(background))
+        fbuf.text(text, 0, 0, _bswap16(color))
 
         # Draw to display
         self._block(x, y, x + w - 1, y + h - 1, buf)
@@ -636,13 +1103,16 @@ class Display:
             color: Line color (default: "white")
         """
         # Optimize straight lines with direct block operations
-        if x1 == x2:  # Vertical line
-            self._draw_vertical_line(x1, y1, y2, color)
+        if x1 == x2 or y1 == y2:  # Vertical or horizontal line
+            self._draw_straight_line(x1, y1, x2, y2, color)
             return
-        elif y1 == y2:  # Horizontal line  
-            self._draw_horizontal_line(x1, x2, y1, color)
+
+        if self._fbuf is not None:
+            # Let framebuf rasterize the line in C
+            self._fbuf.line(x1, y1, x2, y2, _bswap16(self._parse_color(color)))
+            self._fb_show_clipped(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
             return
-        
+
         # For diagonal lines, use the original Bresenham algorithm
         # Estimate number of pixels for smart buffering
         dx = abs(x2 - x1)
@@ -651,6 +1121,7 @@ class Display:
         
         # Use smart buffering for better performance
         was_buffering = self._smart_buffering(pixel_count)
+        color = self._parse_color(color)  # Parse once, not per pixel
 
         # Bresenham's line algorithm
         x, y = x1, y1
@@ -658,8 +1129,21 @@ class Display:
         y_inc = 1 if y1 < y2 else -1
         error = dx - dy
 
+        # Append straight to the pixel buffer while it has room
+        width = self.width
+        height = self.height
+        positions = self._buffer_pos
+        colors = self._buffer_colors
+        room = self.MAX_BUFFERED_PIXELS - len(positions) if self._buffering_enabled else 0
+
         while True:
-            self._buffered_pixel(x, y, color)
+            if 0 <= x < width and 0 <= y < height:
+                if room > 0:
+                    positions.append(y << 16 | x)
+                    colors.append(color)
+                    room -= 1
+                else:
+                    self._buffered_pixel(x, y, color)
             if x == x2 and y == y2:
                 break
             e2 = 2 * error
@@ -674,41 +1158,35 @@ class Display:
         if was_buffering:
             self._flush_buffer()
 
-    def _draw_horizontal_line(self, x1, x2, y, color):
-        """Draw a horizontal line efficiently with a single block operation."""
-        if not self._validate_bounds(x1, y) and not self._validate_bounds(x2, y):
+    def _draw_straight_line(self, x1, y1, x2, y2, color):
+        """Draw a horizontal or vertical line with a single block operation."""
+        if not self._validate_bounds(x1, y1) and not self._validate_bounds(x2, y2):
             return
-            
-        # Ensure x1 <= x2
+
+        # Order the ends, then clip the line to screen bounds
         if x1 > x2:
             x1, x2 = x2, x1
-            
-        # Clip line to screen bounds
-        start_x = max(0, x1)
-        end_x = min(self.width - 1, x2)
-        
-        if start_x <= end_x and 0 <= y < self.height:
-            width = end_x - start_x + 1
-            line_data = self._prepare_color_data(color, width)
-            self._block(start_x, y, end_x, y, line_data)
-
-    def _draw_vertical_line(self, x, y1, y2, color):
-        """Draw a vertical line efficiently with a single block operation."""
-        if not self._validate_bounds(x, y1) and not self._validate_bounds(x, y2):
-            return
-            
-        # Ensure y1 <= y2
         if y1 > y2:
             y1, y2 = y2, y1
-            
-        # Clip line to screen bounds
+        start_x = max(0, x1)
+        end_x = min(self.width - 1, x2)
         start_y = max(0, y1)
         end_y = min(self.height - 1, y2)
-        
-        if start_y <= end_y and 0 <= x < self.width:
-            height = end_y - start_y + 1
-            line_data = self._prepare_color_data(color, height)
-            self._block(x, start_y, x, end_y, line_data)
+        if start_x > end_x or start_y > end_y:
+            return
+
+        color_val = self._parse_color(color)
+        width = end_x - start_x + 1
+        height = end_y - start_y + 1
+
+        if self._fbuf is not None:
+            self._fbuf.fill_rect(start_x, start_y, width, height, _bswap16(color_val))
+            self._fb_show(start_x, start_y, end_x, end_y)
+            return
+
+        # One side is a single pixel, so a cached row always covers the line
+        line_data = self._color_row(color_val)[:width * height * 2]
+        self._block(start_x, start_y, end_x, end_y, line_data)
 
     def draw_rectangle(self, x, y, width, height, color="white", filled=False):
         """Draw a rectangle.
@@ -725,6 +1203,18 @@ class Display:
             
         if filled:
             self.fill_rectangle(x, y, width, height, color)
+        elif x >= 0 and y >= 0 and x + width <= self.width and y + height <= self.height:
+            # Entirely on screen - no clipping needed
+            right = x + width - 1
+            bottom = y + height - 1
+            self._block(x, y, right, y, self._prepare_color_data(color, width))  # Top
+            if height > 1:
+                self._block(x, bottom, right, bottom, self._prepare_color_data(color, width))  # Bottom
+            if height > 2:
+                line_data_vertical = self._prepare_color_data(color, height - 2)
+                self._block(x, y + 1, x, bottom - 1, line_data_vertical)  # Left
+                if width > 1:
+                    self._block(right, y + 1, right, bottom - 1, line_data_vertical)  # Right
         else:
             # Draw outline efficiently using unified clipping
             clipped = self._clip_rectangle(x, y, width, height)
@@ -774,6 +1264,11 @@ class Display:
             
         x, y, width, height = clipped
 
+        if self._fbuf is not None:
+            self._fbuf.fill_rect(x, y, width, height, _bswap16(self._parse_color(color)))
+            self._fb_show(x, y, x + width - 1, y + height - 1)
+            return
+
         # Optimize for different rectangle sizes
         if height <= 8:
             # Small rectangle - single block operation
@@ -781,10 +1276,9 @@ class Display:
             block_data = self._prepare_color_data(color, block_size)
             self._block(x, y, x + width - 1, y + height - 1, block_data)
         else:
-            # Large rectangle - line by line for memory efficiency
+            # Large rectangle - one window, filled line by line
             line_data = self._prepare_color_data(color, width)
-            for row in range(height):
-                self._block(x, y + row, x + width - 1, y + row, line_data)
+            self._fill_block(x, y, x + width - 1, y + height - 1, line_data)
 
     def draw_circle(self, x, y, radius, color="white", filled=False):
         """Draw a circle.
@@ -797,10 +1291,14 @@ class Display:
         """
         if filled:
             self.fill_circle(x, y, radius, color)
+        elif self._fbuf is not None:
+            self._fbuf.ellipse(x, y, radius, radius, _bswap16(self._parse_color(color)))
+            self._fb_show_clipped(x - radius, y - radius, x + radius, y + radius)
         else:
             # Estimate pixel count for smart buffering (circumference approximation)
             pixel_count = int(2 * 3.14159 * radius)
             was_buffering = self._smart_buffering(pixel_count)
+            color = self._parse_color(color)  # Parse once, not per pixel
 
             # Bresenham's circle algorithm
             f = 1 - radius
@@ -844,37 +1342,54 @@ class Display:
             radius (int): Circle radius
             color: Fill color (default: "white")
         """
-        # Use scanline algorithm for efficiency - draw horizontal lines
-        for dy in range(-radius, radius + 1):
-            # Calculate half-width of circle at this y position
-            half_width = int((radius * radius - dy * dy) ** 0.5)
+        if self._fbuf is not None:
+            self._fbuf.ellipse(x, y, radius, radius, _bswap16(self._parse_color(color)), True)
+            self._fb_show_clipped(x - radius, y - radius, x + radius, y + radius)
+            return
+
+        row = self._color_row(self._parse_color(color))
+        max_x = self.width - 1
+        radius2 = radius * radius
+
+        # Use scanline algorithm for efficiency - draw horizontal lines,
+        # visiting only the scanlines that are on screen
+        half_width = 0
+        span_width = -1
+        span_data = None
+        for dy in range(max(-radius, -y), min(radius, self.height - 1 - y) + 1):
+            # Half-width of circle at this y position: the integer square
+            # root of radius² - dy², stepped on from the previous row
+            remaining = radius2 - dy * dy
+            while (half_width + 1) * (half_width + 1) <= remaining:
+                half_width += 1
+            while half_width * half_width > remaining:
+                half_width -= 1
 
             if half_width > 0:
-                # Calculate line bounds
+                # Calculate line bounds, clamped to the screen
                 start_x = x - half_width
                 end_x = x + half_width
-                current_y = y + dy
-
-                # Use unified clipping for the line
-                clipped = self._clip_rectangle(start_x, current_y, end_x - start_x + 1, 1)
-                if clipped:
-                    clip_x, clip_y, clip_width, clip_height = clipped
-                    line_data = self._prepare_color_data(color, clip_width)
-                    self._block(clip_x, clip_y, clip_x + clip_width - 1, clip_y, line_data)
+                if start_x < 0:
+                    start_x = 0
+                if end_x > max_x:
+                    end_x = max_x
+
+                if start_x <= end_x:
+                    # Reuse the row data while the span width repeats
+                    if end_x - start_x + 1 != span_width:
+                        span_width = end_x - start_x + 1
+                        span_data = row[:span_width * 2]
+                    current_y = y + dy
+                    self._block(start_x, current_y, end_x, current_y, span_data)
 
     def _draw_ellipse_points(self, cx, cy, x, y, color_val):
         """Helper method to draw the 4 symmetric points of an ellipse."""
-        pixel_data = color_val.to_bytes(2, "big")
-        
-        # Draw 4 symmetric points
-        if cx + x < self.width and cy + y < self.height and cx + x >= 0 and cy + y >= 0:
-            self._block(cx + x, cy + y, cx + x, cy + y, pixel_data)
-        if cx - x < self.width and cy + y < self.height and cx - x >= 0 and cy + y >= 0:
-            self._block(cx - x, cy + y, cx - x, cy + y, pixel_data)
-        if cx + x < self.width and cy - y < self.height and cx + x >= 0 and cy - y >= 0:
-            self._block(cx + x, cy - y, cx + x, cy - y, pixel_data)
-        if cx - x < self.width and cy - y < self.height and cx - x >= 0 and cy - y >= 0:
-            self._block(cx - x, cy - y, cx - x, cy - y, pixel_data)
+        # Plot 4 symmetric points (buffered while draw_ellipse is running)
+        plot = self._buffered_pixel
+        plot(cx + x, cy + y, color_val)
+        plot(cx - x, cy + y, color_val)
+        plot(cx + x, cy - y, color_val)
+        plot(cx - x, cy - y, color_val)
 
     def draw_ellipse(self, x, y, width, height, color="white", filled=False):
         """Draw an ellipse.
@@ -898,49 +1413,45 @@ class Display:
             return
 
         color_val = self._parse_color(color)
-        
-        # Bresenham ellipse algorithm
-        a2 = a * a
-        b2 = b * b
-        twoa2 = 2 * a2
-        twob2 = 2 * b2
-        
-        # Region 1
-        px = 0
-        py = twoa2 * b
-        
-        # Plot initial points
-        self._draw_ellipse_points(x, y, 0, b, color_val)
-        
-        # Region 1 - horizontal direction
-        p = round(b2 - (a2 * b) + (0.25 * a2))
-        dx = 0
-        dy = b
-        
-        while px < py:
-            dx += 1
-            px += twob2
-            if p < 0:
-                p += b2 + px
-            else:
-                dy -= 1
-                py -= twoa2
-                p += b2 + px - py
-            self._draw_ellipse_points(x, y, dx, dy, color_val)
-            
-        # Region 2 - vertical direction  
-        p = round(b2 * (dx + 0.5) * (dx + 0.5) + a2 * (dy - 1) * (dy - 1) - a2 * b2)
-        
-        while dy > 0:
-            dy -= 1
-            py -= twoa2
-            if p > 0:
-                p += a2 - py
-            else:
-                dx += 1
-                px += twob2
-                p += a2 - py + px
-            self._draw_ellipse_points(x, y, dx, dy, color_val)
+
+        # Buffer the outline so it's sent as row runs rather than single pixels
+        was_buffering = self._smart_buffering(4 * (a + b))
+
+        # The outline never leaves its a x b bounding box, so when that's on
+        # screen the points can be plotted without checking each one
+        fully_inside = x - a >= 0 and y - b >= 0 and x + a < self.width and y + b < self.height
+        positions = self._buffer_pos
+
+        if fully_inside and self._fbuf is not None:
+            pixel = self._fbuf.pixel
+            swapped = _bswap16(color_val)
+            for dx, dy in _ellipse_steps(a, b):
+                pixel(x + dx, y + dy, swapped)
+                pixel(x - dx, y + dy, swapped)
+                pixel(x + dx, y - dy, swapped)
+                pixel(x - dx, y - dy, swapped)
+            self._fb_show(x - a, y - b, x + a, y + b)
+        elif (fully_inside and self._buffering_enabled
+              and len(positions) + 4 * (a + b + 1) <= self.MAX_BUFFERED_PIXELS):
+            add_pos = positions.append
+            add_color = self._buffer_colors.append
+            for dx, dy in _ellipse_steps(a, b):
+                add_pos((y + dy) << 16 | (x + dx))
+                add_pos((y + dy) << 16 | (x - dx))
+                add_pos((y - dy) << 16 | (x + dx))
+                add_pos((y - dy) << 16 | (x - dx))
+                add_color(color_val)
+                add_color(color_val)
+                add_color(color_val)
+                add_color(color_val)
+        else:
+            plot_points = self._draw_ellipse_points
+            for dx, dy in _ellipse_steps(a, b):
+                plot_points(x, y, dx, dy, color_val)
+
+        # Only flush if we started buffering
+        if was_buffering:
+            self._flush_buffer()
 
     def fill_ellipse(self, x, y, width, height, color="white"):
         """Draw a filled ellipse.
@@ -959,30 +1470,51 @@ class Display:
             return
 
         color_val = self._parse_color(color)
+        row = self._color_row(color_val)
+
+        # Consecutive rows with the same half-width (e.g. near the middle of a
+        # tall ellipse) are filled as one band above and one below the center
+        band_half_width = -1
+        band_from = band_to = b
+        for half_width, dy in _ellipse_rows(a, b):
+            if half_width == band_half_width:
+                band_to = dy
+                continue
+            if band_half_width >= 0:
+                self._fill_ellipse_band(x, y, band_half_width, band_from, band_to, row)
+            band_half_width = half_width
+            band_from = band_to = dy
+        self._fill_ellipse_band(x, y, band_half_width, band_from, band_to, row)
+
+    def _fill_ellipse_band(self, x, y, half_width, dy_from, dy_to, row):
+        """Fill the mirrored ellipse rows from dy_from down to dy_to.
 
-        # Use scanline algorithm for efficiency
-        for dy in range(-b, b + 1):
-            # Calculate half-width of ellipse at this y position
-            if b == 0:
-                half_width = 0
-            else:
-                # Ellipse equation: (x/a)² + (y/b)² = 1
-                # Solve for x: x = a * sqrt(1 - (y/b)²)
-                y_ratio = dy / b
-                if abs(y_ratio) <= 1:
-                    half_width = int(a * (1 - y_ratio * y_ratio) ** 0.5)
-                else:
-                    half_width = 0
+        Args:
+            x, y (int): Ellipse center
+            half_width (int): Half-width shared by all rows in the band
+            dy_from, dy_to (int): Row offsets from the center, dy_from >= dy_to
+            row (memoryview): Cached color row to slice the span from
+        """
+        max_y = self.height - 1
+
+        # Check the bands are on screen before doing any span work
+        top_start = max(0, y - dy_from)
+        top_end = min(max_y, y - dy_to)
+        bottom_start = max(0, y + max(dy_to, 1))  # Center row is in the top band
+        bottom_end = min(max_y, y + dy_from)
+        if top_start > top_end and bottom_start > bottom_end:
+            return
 
-            if half_width > 0:
-                start_x = max(0, x - half_width)
-                end_x = min(self.width - 1, x + half_width)
-                current_y = y + dy
+        start_x = max(0, x - half_width)
+        end_x = min(self.width - 1, x + half_width)
+        if start_x > end_x:
+            return
 
-                if 0 <= current_y < self.height and start_x <= end_x:
-                    line_width = end_x - start_x + 1
-                    line_data = color_val.to_bytes(2, "big") * line_width
-                    self._block(start_x, current_y, end_x, current_y, line_data)
+        data = row[:(end_x - start_x + 1) * 2]
+        if top_start <= top_end:
+            self._fill_block(start_x, top_start, end_x, top_end, data)
+        if bottom_start <= bottom_end:
+            self._fill_block(start_x, bottom_start, end_x, bottom_end, data)
 
     def draw_polygon(self, points, color="white", filled=False):
         """Draw a polygon from a list of points.
@@ -998,11 +1530,27 @@ class Display:
         if filled:
             self.fill_polygon(points, color)
         else:
-            # Draw outline by connecting consecutive points
-            for i in range(len(points)):
-                x1, y1 = points[i]
-                x2, y2 = points[(i + 1) % len(points)]  # Wrap to first point
-                self.draw_line(x1, y1, x2, y2, color)
+            # Buffer the whole outline so it's flushed together
+            was_buffering = not self._buffering_enabled
+            if was_buffering:
+                self._start_buffering()
+
+            try:
+                # Draw outline by connecting consecutive points, starting
+                # with the closing edge from the last point to the first
+                x1, y1 = points[-1]
+                for x2, y2 in points:
+                    self.draw_line(x1, y1, x2, y2, color)
+                    x1, y1 = x2, y2
+            finally:
+                # Only flush if we started buffering
+                if was_buffering:
+                    self._flush_buffer()
+
+    # Spans on a scanline separated by at most this many pixels are sent as
+    # one block, painting the gap too. 0 only joins spans that touch, which
+    # never changes the result; raise it when the gaps will be overdrawn anyway
+    SPAN_MERGE_THRESHOLD = 0
 
     def fill_polygon(self, points, color="white"):
         """Draw a filled polygon using scanline algorithm.
@@ -1015,46 +1563,93 @@ class Display:
             return
 
         color_val = self._parse_color(color)
-        
-        # Find bounding box
-        min_y = min(p[1] for p in points)
-        max_y = max(p[1] for p in points)
-        
+        row = self._color_row(color_val)
+
+        # Edge table is cached, so redrawing the same polygon skips this setup
+        min_y, max_y, edges = _get_edge_table(points)
+
         # Clip to screen bounds
         min_y = max(0, min_y)
         max_y = min(self.height - 1, max_y)
-        
+
+        # Scratch space for each scanline's intersections (reused every row)
+        intersections = array("i", [0] * len(edges))
+
+        # Row data for the last span width, reused while widths repeat
+        span_width = -1
+        span_data = None
+
+        block = self._block
+        max_x = self.width - 1
+        merge_reach = self.SPAN_MERGE_THRESHOLD + 1
+
+        # Active edge table: [edge_max_y, x, remainder, x_step, remainder_step,
+        # denominator] for each edge crossing the current scanline. x steps
+        # exactly along the edge (same floor rounding as x1 + (y-y1)*dx//dy)
+        # using only integer adds.
+        active = []
+        next_edge = 0
+        edge_count = len(edges)
+
         # For each scanline
         for y in range(min_y, max_y + 1):
-            intersections = []
-            
-            # Find intersections with polygon edges
-            for i in range(len(points)):
-                x1, y1 = points[i]
-                x2, y2 = points[(i + 1) % len(points)]
-                
-                # Skip horizontal edges
-                if y1 == y2:
+            if not active and next_edge == edge_count:
+                break  # Every edge has ended - nothing left on screen
+
+            # Add edges that start on (or, when clipped, above) this scanline
+            while next_edge < edge_count and edges[next_edge][0] <= y:
+                edge_min_y, edge_max_y, x1, y1, dx, dy, x_step, remainder_step = edges[next_edge]
+                next_edge += 1
+                if y < edge_max_y:
+                    offset = (y - y1) * dx
+                    active.append([edge_max_y, x1 + offset // dy, offset % dy,
+                                   x_step, remainder_step, dy])
+
+            count = 0
+            i = len(active)
+            while i:
+                i -= 1
+                edge = active[i]
+                if edge[0] <= y:
+                    del active[i]  # Edge ended above this scanline
                     continue
-                    
-                # Check if scanline intersects this edge
-                if (y1 <= y < y2) or (y2 <= y < y1):
-                    # Calculate intersection x coordinate
-                    if y2 != y1:  # Avoid division by zero
-                        x_intersect = x1 + (y - y1) * (x2 - x1) // (y2 - y1)
-                        intersections.append(x_intersect)
-            
-            # Sort intersections and fill between pairs
-            intersections.sort()
-            for i in range(0, len(intersections), 2):
-                if i + 1 < len(intersections):
-                    start_x = max(0, intersections[i])
-                    end_x = min(self.width - 1, intersections[i + 1])
-                    
-                    if start_x <= end_x:
-                        line_width = end_x - start_x + 1
-                        line_data = color_val.to_bytes(2, "big") * line_width
-                        self._block(start_x, y, end_x, y, line_data)
+
+                x_intersect = edge[1]
+
+                # Insertion sort as we go - a row only has a few crossings
+                j = count - 1
+                while j >= 0 and intersections[j] > x_intersect:
+                    intersections[j + 1] = intersections[j]
+                    j -= 1
+                intersections[j + 1] = x_intersect
+                count += 1
+
+                # Step the edge down to the next scanline
+                edge[1] += edge[3]
+                edge[2] += edge[4]
+                if edge[2] >= edge[5]:
+                    edge[2] -= edge[5]
+                    edge[1] += 1
+
+            # Fill between pairs, joining spans separated by small gaps
+            i = 0
+            last = count - 1
+            while i < last:
+                start_x = intersections[i]
+                end_x = intersections[i + 1]
+                i += 2
+                while i < last and intersections[i] - end_x <= merge_reach:
+                    end_x = intersections[i + 1]
+                    i += 2
+
+                start_x = max(0, start_x)
+                end_x = min(max_x, end_x)
+                if start_x <= end_x:
+                    line_width = end_x - start_x + 1
+                    if line_width != span_width:
+                        span_width = line_width
+                        span_data = row[:line_width * 2]
+                    block(start_x, y, end_x, y, span_data)
 
     def display_on(self):
         """Turn the display on."""
@@ -1102,6 +1697,40 @@ class Display:
         """End a buffered drawing operation and flush to display."""
         self._flush_buffer()
 
+    def begin_frame(self):
+        """Keep the display selected while drawing a whole frame.
+
+        Normally every shape selects and releases the display on its own.
+        Between begin_frame() and end_frame() it stays selected, which saves
+        a little time per shape. Must be paired with end_frame().
+        """
+        if not self._in_frame:
+            self.cs.off()
+            self._in_frame = True
+
+    def end_frame(self):
+        """Release the display after begin_frame()."""
+        if self._in_frame:
+            self._in_frame = False
+            self.cs.on()
+
+    def frame(self):
+        """Draw a frame with the display held selected.
+
+        Example:
+            with display.frame():
+                display.clear()
+                display.draw_circle(160, 120, 50, "red")
+        """
+        return self
+
+    def __enter__(self):
+        self.begin_frame()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_frame()
+
 
 # Convenience functions for even simpler usage
 _default_display = None
@@ -1110,18 +1739,43 @@ def _ensure_default_display(func_name):
     """Decorator to ensure default display is initialized before calling function."""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            global _default_display
             if _default_display is None:
                 init()
             return getattr(_default_display, func_name)(*args, **kwargs)
         return wrapper
     return decorator
 
+# Convenience function names and the Display methods they call
+_CONVENIENCE_METHODS = (
+    ("show_text", "show_text"),
+    ("show_text_at", "show_text_at"),
+    ("clear", "clear"),
+    ("draw_circle", "draw_circle"),
+    ("draw_rectangle", "draw_rectangle"),
+    ("begin_drawing", "begin_drawing"),
+    ("end_drawing", "end_drawing"),
+    ("begin_frame", "begin_frame"),
+    ("end_frame", "end_frame"),
+    ("draw_pixel", "draw_pixel"),
+    ("draw_line", "draw_line"),
+    ("draw_ellipse", "draw_ellipse"),
+    ("draw_polygon", "draw_polygon"),
+    ("display_on", "display_on"),
+    ("display_off", "display_off"),
+    ("display_sleep", "sleep"),
+)
+
 def init():
     """Initialize the default display instance."""
     global _default_display
     _default_display = Display()
 
+    # Point the module-level functions straight at the display's bound
+    # methods so later calls skip the "is it initialized?" check
+    module_globals = globals()
+    for func_name, method_name in _CONVENIENCE_METHODS:
+        module_globals[func_name] = getattr(_default_display, method_name)
+
 
 def show_text(text, color="white", background="black"):
     """Show text using the default display.
@@ -1193,6 +1847,16 @@ def end_drawing():
     """End buffered drawing and flush to display."""
     pass  # Implementation handled by decorator
 
+@_ensure_default_display("begin_frame")
+def begin_frame():
+    """Keep the display selected while drawing a frame."""
+    pass  # Implementation handled by decorator
+
+@_ensure_default_display("end_frame")
+def end_frame():
+    """Release the display after begin_frame()."""
+    pass  # Implementation handled by decorator
+
 @_ensure_default_display("draw_pixel")
 def draw_pixel(x, y, color="white"):
     """Draw a pixel using the default display.
@@ -48,9 +48,17 @@ Convenience functions for simple usage:
     easy_radio.set_group(0)  # Promiscuous mode
 """
 
+from binascii import hexlify
 import network
 import espnow
-from time import ticks_ms
+from time import sleep_ms, ticks_diff, ticks_ms
+
+_BROADCAST = b'\xff\xff\xff\xff\xff\xff'  # Broadcast peer address
+
+
+def _format_mac(mac):
+    """Format a MAC address as "aa:bb:cc:dd:ee:ff"."""
+    return hexlify(mac, ':').decode()
 
 
 class Radio:
@@ -71,21 +79,39 @@ class Radio:
         self._channel = channel
         self._tx_power = tx_power
         self._group = group
-        self._stats = {
-            'sent': 0,
-            'received': 0,
-            'errors': 0
-        }
+        
+        # Statistics counters (plain attributes are quicker to update than
+        # dict items; get_stats() builds the dict)
+        self._sent = 0
+        self._received = 0
+        self._errors = 0
+        self._dropped = 0
+        
         self._peer_rssi = {}  # Store RSSI for each peer
-        self._last_error = None
+        self._mac_strings = {}  # Formatted address for each sender
+        self._known_peers = set()  # Senders already passed to add_peer
         
-        # Message queue for buffering received messages
-        self._message_queue = []
-        self._max_queue_size = queue_size
+        # Reusable buffer for outgoing messages (ESP-NOW max payload)
+        self._send_buf = bytearray(250)
+        self._send_view = memoryview(self._send_buf)
+        self._last_error = None
+        self._in_callback = False
         
-        # Validate group
+        # Validate group and queue size
         if not (0 <= group <= 255):
             raise ValueError("Group must be between 0 (promiscuous) and 255")
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1")
+        
+        # Message queue for buffering received messages. It's a fixed ring
+        # buffer so queuing from the callback never shifts or reallocates;
+        # one slot is always left empty to tell a full queue from an empty one.
+        # Only the callback moves the tail and only the receiving side moves
+        # the head, so the callback can run mid-receive without losing track
+        self._message_queue = [None] * (queue_size + 1)
+        self._queue_head = 0  # Oldest queued message
+        self._queue_tail = 0  # Next free slot
+        self._max_queue_size = queue_size
         
         # Initialize the radio
         self._init_radio()
@@ -138,9 +164,8 @@ class Radio:
             self._espnow.irq(self._on_message_received)
             
             # Add broadcast peer for sending to all devices
-            broadcast_mac = b'\xff\xff\xff\xff\xff\xff'
             try:
-                self._espnow.add_peer(broadcast_mac)
+                self._espnow.add_peer(_BROADCAST)
             except OSError:
                 # Peer might already exist, that's OK
                 pass
@@ -179,57 +204,55 @@ class Radio:
         to the queue for later retrieval via receive(). Messages are filtered
         by group unless in promiscuous mode (group 0).
         
+        Only the raw message is queued here - decoding and building the
+        message info is left to receive(), so the callback stays short.
+        
         Args:
             espnow_instance: The ESP-NOW instance that triggered the interrupt
         """
+        # A callback already running will drain any new messages too
+        if self._in_callback:
+            return
+        self._in_callback = True
+        
         try:
+            # Local names for everything used per message
+            group = self._group
+            irecv = espnow_instance.irecv
+            parse_message = self._parse_message
+            queue_message = self.queue_message
+            now = ticks_ms
+            
             # Read all available messages
             while True:
-                mac, msg = espnow_instance.irecv(0)
+                mac, msg = irecv(0)
                 if mac is None:
                     break  # No more messages
                 
+                # Filter by group first (unless we're in promiscuous mode) -
+                # most messages in a busy room are for other groups
+                if group and msg and msg[0] != group:
+                    continue  # Not our group, ignore
+                
                 # Parse and validate message using secure parser
-                parsed = self._parse_message(msg)
+                parsed = parse_message(msg)
                 if parsed is None:
                     continue  # Invalid message format
                 
                 msg_group, message_bytes = parsed
                 
-                # Filter by group (unless we're in promiscuous mode)
-                if self._group != 0 and msg_group != self._group:
-                    continue  # Not our group, ignore
-                
-                # Decode message
-                try:
-                    text = message_bytes.decode('utf-8')
-                except UnicodeDecodeError:
-                    text = str(message_bytes)
-                
-                # Format MAC address
-                sender = ':'.join('%02x' % b for b in mac)
-                
-                # Get RSSI (may not be reliable)
-                rssi = self._get_peer_rssi(mac)
-                
-                # Create message info with group information
-                message_info = {
-                    'sender': sender,
-                    'text': text,
-                    'rssi': rssi,
-                    'time': ticks_ms(),
-                    'group': msg_group  # Include original group
-                }
-                
-                # Add to queue (this handles overflow automatically)
-                self.queue_message(message_info)
+                # irecv() reuses its buffers, so keep a copy of the address
+                # (the message bytes are already a copy)
+                queue_message((bytes(mac), msg_group, message_bytes, now()))
                 
                 # Update stats
-                self._stats['received'] += 1
+                self._received += 1
                 
         except Exception as e:
-            self._stats['errors'] += 1
+            self._errors += 1
             self._last_error = f"Message callback error: {e}"
+        finally:
+            self._in_callback = False
     
     def send(self, message):
         """Send a message to all nearby radios in the same group.
@@ -240,37 +263,38 @@ class Radio:
         Returns:
             bool: True if message was sent successfully, False otherwise
         """
-        if not isinstance(message, str):
-            message = str(message)
-        
         try:
             # Create message with group header
             # Format: [group_byte][length_byte][message_bytes]
-            msg_bytes = message.encode('utf-8')
+            try:
+                msg_bytes = message.encode('utf-8')
+            except AttributeError:
+                # Not a string (e.g. a number) - send its text form
+                msg_bytes = str(message).encode('utf-8')
             
             # ESP-NOW max payload is 250 bytes, reserve 2 for header
             if len(msg_bytes) > 248:
-                # Truncate by bytes to ensure valid UTF-8
-                msg_bytes = msg_bytes[:248]
-                # Ensure we don't break UTF-8 encoding
-                while len(msg_bytes) > 0:
-                    try:
-                        msg_bytes.decode('utf-8')
-                        break
-                    except UnicodeDecodeError:
-                        msg_bytes = msg_bytes[:-1]
+                # Truncate by bytes, backing up over continuation bytes
+                # (0b10xxxxxx) so a multi-byte character isn't cut in half
+                end = 248
+                while end and msg_bytes[end] & 0xC0 == 0x80:
+                    end -= 1
+                msg_bytes = msg_bytes[:end]
             
-            header = bytes([self._group, len(msg_bytes)])
-            full_message = header + msg_bytes
+            # Build the message in place rather than joining new bytes objects
+            msg_length = len(msg_bytes)
+            send_buf = self._send_buf
+            send_buf[0] = self._group
+            send_buf[1] = msg_length
+            send_buf[2:2 + msg_length] = msg_bytes
             
             # Send to broadcast address
-            broadcast_mac = b'\xff\xff\xff\xff\xff\xff'
-            self._espnow.send(broadcast_mac, full_message, True)
-            self._stats['sent'] += 1
+            self._espnow.send(_BROADCAST, self._send_view[:2 + msg_length], True)
+            self._sent += 1
             return True
                 
         except Exception as e:
-            self._stats['errors'] += 1
+            self._errors += 1
             self._last_error = f"Send error: {e}"
             return False
     
@@ -288,50 +312,45 @@ class Radio:
                          Returns None if no message received
         """
         # Check if we have queued messages
-        if self._message_queue:
-            return self._message_queue.pop(0)
-        
-        # If no messages and timeout is 0, return immediately
-        if timeout_ms == 0:
-            return None
-        
-        # Wait for a message to arrive (polling the queue)
+        message_info = self._next_message()
+        if message_info is not None or timeout_ms == 0:
+            return message_info
+        
+        # Wait for a message to arrive (polling the queue). The callback
+        # queues messages while we sleep; polling 16 times over the timeout
+        # (at least every 1ms) keeps wakeups low for long waits while
+        # short waits still notice a new message quickly
         start_time = ticks_ms()
+        poll_ms = max(1, timeout_ms >> 4)
         
         while True:
             # Check queue again
-            if self._message_queue:
-                return self._message_queue.pop(0)
+            message_info = self._next_message()
+            if message_info is not None:
+                return message_info
             
             # Check if timeout exceeded
-            elapsed = ticks_ms() - start_time
+            elapsed = ticks_diff(ticks_ms(), start_time)
             if elapsed >= timeout_ms:
                 return None
             
-            # Small delay to prevent busy waiting
-            try:
-                # MicroPython
-                import time
-                time.sleep_ms(min(10, timeout_ms - elapsed))
-            except (ImportError, AttributeError):
-                # Standard Python fallback
-                import time
-                time.sleep(min(0.01, (timeout_ms - elapsed) / 1000.0))
-            
-        return None
+            sleep_ms(min(poll_ms, timeout_ms - elapsed))
     
     def _get_peer_rssi(self, mac_addr):
         """Get RSSI for a peer (signal strength)."""
         try:
             # Try to get RSSI from peers table
-            peer = self._espnow.peers_table.get(mac_addr, [-100, 0])
-            rssi = peer[0]
+            peer = self._espnow.peers_table.get(mac_addr)
+            rssi = peer[0] if peer else -100
             
-            # If not found in peers, add them and return default
-            try:
-                self._espnow.add_peer(mac_addr)
-            except OSError:
-                pass
+            # Add new senders as peers (only once - the call is slow and
+            # raises if the peer exists or the peer list is full)
+            if mac_addr not in self._known_peers:
+                self._known_peers.add(mac_addr)
+                try:
+                    self._espnow.add_peer(mac_addr)
+                except OSError:
+                    pass
             return rssi
                 
         except Exception:
@@ -345,7 +364,7 @@ class Radio:
         """
         if self._wlan:
             mac = self._wlan.config('mac')
-            return ':'.join('%02x' % b for b in mac)
+            return _format_mac(mac)
         return "unknown"
     
     def get_channel(self):
@@ -362,9 +381,15 @@ class Radio:
         """Get radio statistics.
         
         Returns:
-            dict: Statistics with keys 'sent', 'received', 'errors'
+            dict: Statistics with keys 'sent', 'received', 'errors', and
+                'dropped' (new messages lost because the queue was full)
         """
-        return self._stats.copy()
+        return {
+            'sent': self._sent,
+            'received': self._received,
+            'errors': self._errors,
+            'dropped': self._dropped
+        }
     
     def get_last_error(self):
         """Get the last error message.
@@ -376,11 +401,10 @@ class Radio:
     
     def reset_stats(self):
         """Reset all statistics counters."""
-        self._stats = {
-            'sent': 0,
-            'received': 0,
-            'errors': 0
-        }
+        self._sent = 0
+        self._received = 0
+        self._errors = 0
+        self._dropped = 0
         self._last_error = None
     
     def receive_all(self):
@@ -389,24 +413,119 @@ class Radio:
         Returns:
             list: List of message dictionaries, empty list if no messages
         """
-        messages = self._message_queue.copy()
-        self._message_queue.clear()
-        return messages
-    
-    def queue_message(self, message_info):
+        # Take everything off the queue in one pass, then build the message
+        # info once the slots are free for the callback again
+        queue = self._message_queue
+        head = self._queue_head
+        tail = self._queue_tail
+        entries = []
+        while head != tail:
+            entries.append(queue[head])
+            queue[head] = None
+            head += 1
+            if head == len(queue):
+                head = 0
+        self._queue_head = head
+        
+        return [self._message_info(entry) for entry in entries]
+    
+    def queue_message(self, entry):
         """Add a message to the queue (internal method for background receiving).
         
         Args:
-            message_info (dict): Message information dictionary
+            entry (tuple): Raw message as (mac, group, message_bytes, time)
+        """
+        queue = self._message_queue
+        tail = self._queue_tail
+        next_tail = tail + 1
+        if next_tail == len(queue):
+            next_tail = 0
+        
+        # If the queue is full, drop the new message. Making room by moving
+        # the head would race with receive(), which may be part way through
+        # taking a message off the queue
+        if next_tail == self._queue_head:
+            self._dropped += 1
+            return
+        
+        queue[tail] = entry
+        self._queue_tail = next_tail
+    
+    def _pop_message(self):
+        """Remove and return the oldest queued raw message.
+        
+        Returns:
+            tuple or None: (mac, group, message_bytes, time), or None if the
+                queue is empty
+        """
+        head = self._queue_head
+        if head == self._queue_tail:
+            return None
+        
+        queue = self._message_queue
+        entry = queue[head]
+        queue[head] = None  # Don't keep a reference to the message
+        head += 1
+        if head == len(queue):
+            head = 0
+        self._queue_head = head
+        return entry
+    
+    MAC_CACHE_SIZE = 32  # Sender addresses kept already formatted
+    
+    def _next_message(self):
+        """Remove the oldest queued message and build its message info.
+        
+        Returns:
+            dict or None: Message info, or None if the queue is empty
+        """
+        entry = self._pop_message()
+        if entry is None:
+            return None
+        return self._message_info(entry)
+    
+    def _message_info(self, entry):
+        """Build the message info dictionary for a raw queued message.
+        
+        Args:
+            entry (tuple): Raw message as (mac, group, message_bytes, time)
+            
+        Returns:
+            dict: Message info with keys 'sender', 'text', 'rssi', 'time', 'group'
         """
-        # Add to queue, removing oldest if at capacity
-        if len(self._message_queue) >= self._max_queue_size:
-            self._message_queue.pop(0)  # Remove oldest
-        self._message_queue.append(message_info)
+        mac, msg_group, message_bytes, received_time = entry
+        
+        # Decode message. MicroPython ignores 'replace' and raises
+        # UnicodeError (it has no UnicodeDecodeError) on invalid UTF-8
+        try:
+            text = message_bytes.decode('utf-8', 'replace')
+        except UnicodeError:
+            text = str(message_bytes)
+        
+        # Format MAC address (cached, as most messages come from a few senders)
+        sender = self._mac_strings.get(mac)
+        if sender is None:
+            if len(self._mac_strings) >= self.MAC_CACHE_SIZE:
+                self._mac_strings.clear()
+            sender = _format_mac(mac)
+            self._mac_strings[mac] = sender
+        
+        # Get RSSI (may not be reliable)
+        rssi = self._get_peer_rssi(mac)
+        
+        # Create message info with group information
+        return {
+            'sender': sender,
+            'text': text,
+            'rssi': rssi,
+            'time': received_time,
+            'group': msg_group  # Include original group
+        }
     
     def clear_queue(self):
         """Clear all queued messages."""
-        self._message_queue.clear()
+        while self._pop_message() is not None:
+            pass
     
     def queue_size(self):
         """Get current number of queued messages.
@@ -414,7 +533,7 @@ class Radio:
         Returns:
             int: Number of messages in queue
         """
-        return len(self._message_queue)
+        return (self._queue_tail - self._queue_head) % len(self._message_queue)
     
     def set_channel(self, channel):
         """Change the WiFi channel with minimal interruption.
@@ -519,6 +638,7 @@ class Radio:
             except Exception:
                 pass
             self._espnow = None
+            self._known_peers.clear()
         
         if self._wlan:
             try:
@@ -535,13 +655,28 @@ def _ensure_default_radio(func_name):
     """Decorator to ensure default radio is initialized before calling function."""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            global _default_radio  
             if _default_radio is None:
                 init()
             return getattr(_default_radio, func_name)(*args, **kwargs)
         return wrapper
     return decorator
 
+# Convenience function names and the Radio methods they call
+_CONVENIENCE_METHODS = (
+    ("send", "send"),
+    ("receive", "receive"),
+    ("my_address", "get_my_address"),
+    ("stats", "get_stats"),
+    ("receive_all", "receive_all"),
+    ("clear_queue", "clear_queue"),
+    ("queue_size", "queue_size"),
+    ("set_channel", "set_channel"),
+    ("set_power", "set_power"),
+    ("get_power", "get_power"),
+    ("set_group", "set_group"),
+    ("get_group", "get_group"),
+)
+
 def init(channel=None):
     """Initialize the default radio instance.
     
@@ -550,6 +685,12 @@ def init(channel=None):
     """
     global _default_radio
     _default_radio = Radio(channel=channel)
+    
+    # Point the module-level functions straight at the radio's bound
+    # methods so later calls skip the "is it initialized?" check
+    module_globals = globals()
+    for func_name, method_name in _CONVENIENCE_METHODS:
+        module_globals[func_name] = getattr(_default_radio, method_name)
 
 @_ensure_default_radio("send")
 def send(message):